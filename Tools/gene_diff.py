@@ -0,0 +1,436 @@
+from utils import load_generation, iter_genomes
+
+# Node types as serialized by NEAT.NodeGeneType
+HIDDEN = 1
+
+# Connection status as serialized by NEAT.ConnectionStatus
+ENABLED = 0
+
+# Slack for float32 rounding when telling weight tweaks from replacements
+_TWEAK_TOLERANCE = 1e-5
+
+_EVENTS = (
+    "genomes",
+    "prev_genomes",
+    "genes",
+    "matched",
+    "added",
+    "unchanged",
+    "tweaked",
+    "replaced",
+    "enabled",
+    "disabled",
+    "nodes_added",
+)
+
+# Expected instance counts, so these are fractional
+_LOSSES = ("removed", "nodes_removed")
+
+
+def flatten_generation(data):
+    """
+    Flatten a generation snapshot into sorted numpy gene arrays.
+
+    Connection genes are sorted by innovation id and then by weight, so
+    consecutive generations can be merge-joined with np.searchsorted.
+
+    Args:
+        data: The generation snapshot dictionary
+
+    Returns:
+        A dictionary of parallel arrays: "species", "innovation", "weight" and
+        "enabled" for connection genes, "node_species" and "node" for hidden
+        node genes, plus the species ids and their member counts
+    """
+    import numpy as np
+
+    species, innovation, weight, enabled = [], [], [], []
+    node_species, node = [], []
+    member_species = []
+
+    for species_id, genome in iter_genomes(data):
+        sid = int(species_id)
+        member_species.append(sid)
+        for conn in genome["ConnectionGenes"].values():
+            species.append(sid)
+            innovation.append(conn["Id"])
+            weight.append(conn["Weight"])
+            enabled.append(conn["Status"] == ENABLED)
+        for node_data in genome["NodeGenes"].values():
+            if node_data["Type"] == HIDDEN:
+                node_species.append(sid)
+                node.append(node_data["Id"])
+
+    innovation = np.array(innovation, dtype=np.int64)
+    weight = np.array(weight, dtype=np.float64)
+    order = np.lexsort((weight, innovation))
+
+    species_ids, genome_counts = np.unique(
+        np.array(member_species, dtype=np.int64), return_counts=True
+    )
+
+    return {
+        "species": np.array(species, dtype=np.int64)[order],
+        "innovation": innovation[order],
+        "weight": weight[order],
+        "enabled": np.array(enabled, dtype=bool)[order],
+        "node_species": np.array(node_species, dtype=np.int64),
+        "node": np.array(node, dtype=np.int64),
+        "species_ids": species_ids,
+        "genome_counts": genome_counts,
+    }
+
+
+def _match_parents(prev, curr):
+    """
+    Find, for each gene of curr, the gene of prev with the same innovation id
+    and the closest weight.
+
+    Returns:
+        A tuple (matched, parent) where matched is a boolean mask over curr
+        genes and parent holds indexes into prev (valid where matched)
+    """
+    import numpy as np
+
+    if len(prev["innovation"]) == 0:
+        empty = np.zeros(len(curr["innovation"]), dtype=np.int64)
+        return empty.astype(bool), empty
+
+    # Pack (innovation, weight) into one sortable key; the stride keeps
+    # weights of different innovations from overlapping
+    max_abs = max(
+        np.abs(prev["weight"]).max(initial=0), np.abs(curr["weight"]).max(initial=0)
+    )
+    stride = 2 * max_abs + 1
+    prev_key = prev["innovation"] * stride + prev["weight"]
+    curr_key = curr["innovation"] * stride + curr["weight"]
+
+    right = np.searchsorted(prev_key, curr_key).clip(max=len(prev_key) - 1)
+    left = (right - 1).clip(min=0)
+
+    left_ok = prev["innovation"][left] == curr["innovation"]
+    right_ok = prev["innovation"][right] == curr["innovation"]
+    left_delta = np.where(
+        left_ok, np.abs(prev["weight"][left] - curr["weight"]), np.inf
+    )
+    right_delta = np.where(
+        right_ok, np.abs(prev["weight"][right] - curr["weight"]), np.inf
+    )
+
+    parent = np.where(left_delta <= right_delta, left, right)
+    matched = left_ok | right_ok
+
+    return matched, parent
+
+
+def _group_sizes(species_ids, genome_counts, query):
+    """Look up the genome count of each species in query (0 if absent)."""
+    import numpy as np
+
+    if not len(species_ids):
+        return np.zeros(len(query), dtype=np.int64)
+    idx = np.searchsorted(species_ids, query).clip(max=len(species_ids) - 1)
+    return np.where(species_ids[idx] == query, genome_counts[idx], 0)
+
+
+def _lost(prev_species, prev_ids, curr_species, curr_ids, prev_sizes, curr_sizes):
+    """
+    Estimate lost gene instances per (species, id) pair.
+
+    The instance count of each pair in prev is first scaled by how much its
+    species grew or shrank, so only drops in frequency register as losses.
+
+    Args:
+        prev_species, prev_ids: Parallel arrays of the previous generation
+        curr_species, curr_ids: Parallel arrays of the current generation
+        prev_sizes, curr_sizes: Tuples (species_ids, genome_counts) of each
+            generation
+
+    Returns:
+        A tuple (species, losses) over the distinct pairs of prev, where
+        losses is how many fewer instances of the pair curr holds than its
+        scaled previous count (at least 0)
+    """
+    import numpy as np
+
+    # Pack pairs into single integers so plain 1-D set operations apply
+    stride = max(prev_ids.max(initial=0), curr_ids.max(initial=0)) + 1
+    prev_keys, prev_counts = np.unique(
+        prev_species * stride + prev_ids, return_counts=True
+    )
+    curr_keys, curr_counts = np.unique(
+        curr_species * stride + curr_ids, return_counts=True
+    )
+
+    idx = np.searchsorted(curr_keys, prev_keys).clip(max=max(len(curr_keys) - 1, 0))
+    present = (
+        curr_keys[idx] == prev_keys
+        if len(curr_keys)
+        else np.zeros(len(prev_keys), dtype=bool)
+    )
+    remaining = np.where(present, curr_counts[idx] if len(curr_counts) else 0, 0)
+
+    species = prev_keys // stride
+    # Every pair of prev comes from a species with at least one genome in prev
+    growth = _group_sizes(*curr_sizes, species) / _group_sizes(*prev_sizes, species)
+
+    return species, (prev_counts * growth - remaining).clip(min=0)
+
+
+def _rates(counts):
+    """Normalize raw event counts into per-genome and per-gene rates."""
+    genomes = counts["genomes"] or 1
+    prev_genomes = counts["prev_genomes"] or 1
+    matched = counts["matched"] or 1
+
+    return {
+        "added_per_genome": counts["added"] / genomes,
+        "nodes_added_per_genome": counts["nodes_added"] / genomes,
+        "removed_per_genome": counts["removed"] / prev_genomes,
+        "nodes_removed_per_genome": counts["nodes_removed"] / prev_genomes,
+        "enabled_per_genome": counts["enabled"] / genomes,
+        "disabled_per_genome": counts["disabled"] / genomes,
+        "tweak_rate": counts["tweaked"] / matched,
+        "replace_rate": counts["replaced"] / matched,
+        "enable_rate": counts["enabled"] / matched,
+        "disable_rate": counts["disabled"] / matched,
+    }
+
+
+def diff_flattened(prev, curr, tweak_multiplier):
+    """
+    Reconstruct mutation events between two flattened generations.
+
+    Children are not linked to their parents in the snapshots, so each gene is
+    compared with the closest-weighted gene of the same innovation in the
+    previous generation. Events are attributed to the species the child
+    belongs to in the current generation.
+
+    - added: gene whose innovation id did not exist in the previous generation
+    - removed: how many fewer instances of each innovation a species holds
+      than its previous count scaled by the species' change in size, summed
+      over innovations
+    - unchanged / tweaked / replaced: weight moved by 0, at most
+      tweak_multiplier, or more
+    - enabled / disabled: status differs from the matched gene
+    - nodes_added / nodes_removed: the same as added / removed, for hidden
+      nodes
+
+    Mapping to the genome config (see NEAT.Genome.Mutate):
+
+    - NodeAddProb: nodes_added (each one also adds two connection genes)
+    - NodeDeleteProb: nodes_removed. Removing a node also removes its
+      connection genes, and this is the only mutation that removes genes.
+    - ConnAddProb: added connection genes beyond those from node additions.
+      Re-adding an existing connection only shows up as enabled.
+    - ConnDeleteProb: disabled_per_genome. MutateConnDelete only disables a
+      gene and never removes it. Mutate calls it twice and MutateNodeAdd also
+      disables the connection it splits, so expect roughly
+      2 * ConnDeleteProb + NodeAddProb before crossover noise.
+    - TweakWeightProb / ReplaceWeightProb: tweaked / replaced. A replace runs
+      after a tweak and overrides it, and replacements that land close to
+      some other gene of the same innovation are counted as tweaks.
+
+    Per-genome removals are divided by the previous generation's genome
+    count. Scaling by species size cancels out population size changes, but
+    genes and nodes that selection drives out of a species still count as
+    removed.
+
+    Crossover takes the status of a matching gene from a random parent, so
+    children of parents that disagree show spurious enabled / disabled
+    flips when matched against the other parent.
+
+    Args:
+        prev: The flattened previous generation (see flatten_generation)
+        curr: The flattened current generation
+        tweak_multiplier: The TweakMultiplier of the genome config
+
+    Returns:
+        A dictionary with "population" and "species" (species id -> stats)
+        entries, each holding raw event counts and the rates from _rates
+    """
+    import numpy as np
+
+    species_ids = curr["species_ids"]
+    n_species = len(species_ids)
+
+    def per_species(values, mask=None):
+        if mask is not None:
+            values = values[mask]
+        return np.bincount(np.searchsorted(species_ids, values), minlength=n_species)
+
+    matched, parent = _match_parents(prev, curr)
+    if len(prev["weight"]):
+        delta = np.abs(curr["weight"] - prev["weight"][parent])
+        parent_enabled = prev["enabled"][parent]
+    else:
+        delta = np.zeros_like(curr["weight"])
+        parent_enabled = curr["enabled"]
+    tweak_limit = tweak_multiplier + _TWEAK_TOLERANCE
+
+    new_nodes = ~np.isin(curr["node"], prev["node"])
+
+    counts = {
+        "genomes": curr["genome_counts"],
+        "genes": per_species(curr["species"]),
+        "matched": per_species(curr["species"], matched),
+        "added": per_species(curr["species"], ~matched),
+        "unchanged": per_species(curr["species"], matched & (delta == 0)),
+        "tweaked": per_species(
+            curr["species"], matched & (delta > 0) & (delta <= tweak_limit)
+        ),
+        "replaced": per_species(curr["species"], matched & (delta > tweak_limit)),
+        "enabled": per_species(
+            curr["species"], matched & ~parent_enabled & curr["enabled"]
+        ),
+        "disabled": per_species(
+            curr["species"], matched & parent_enabled & ~curr["enabled"]
+        ),
+        "nodes_added": per_species(curr["node_species"], new_nodes),
+    }
+
+    def per_species_losses(species, losses):
+        # Species that died out have nothing to attribute their losses to
+        mask = np.isin(species, species_ids)
+        return np.bincount(
+            np.searchsorted(species_ids, species[mask]),
+            weights=losses[mask],
+            minlength=n_species,
+        )
+
+    counts["prev_genomes"] = _group_sizes(
+        prev["species_ids"], prev["genome_counts"], species_ids
+    )
+    prev_sizes = (prev["species_ids"], prev["genome_counts"])
+    curr_sizes = (species_ids, curr["genome_counts"])
+    counts["removed"] = per_species_losses(
+        *_lost(
+            prev["species"],
+            prev["innovation"],
+            curr["species"],
+            curr["innovation"],
+            prev_sizes,
+            curr_sizes,
+        )
+    )
+    counts["nodes_removed"] = per_species_losses(
+        *_lost(
+            prev["node_species"],
+            prev["node"],
+            curr["node_species"],
+            curr["node"],
+            prev_sizes,
+            curr_sizes,
+        )
+    )
+
+    # Population-wide losses ignore genomes moving between species
+    population = {key: int(counts[key].sum()) for key in _EVENTS}
+    population["prev_genomes"] = int(prev["genome_counts"].sum())
+    single = np.zeros(1, dtype=np.int64)
+    prev_total = (single, np.array([population["prev_genomes"]]))
+    curr_total = (single, np.array([population["genomes"]]))
+    for key, prev_ids, curr_ids in (
+        ("removed", prev["innovation"], curr["innovation"]),
+        ("nodes_removed", prev["node"], curr["node"]),
+    ):
+        population[key] = float(
+            _lost(
+                np.zeros_like(prev_ids),
+                prev_ids,
+                np.zeros_like(curr_ids),
+                curr_ids,
+                prev_total,
+                curr_total,
+            )[1].sum()
+        )
+    population.update(_rates(population))
+
+    species = {}
+    for idx, sid in enumerate(species_ids):
+        stats = {key: int(counts[key][idx]) for key in _EVENTS}
+        stats.update({key: float(counts[key][idx]) for key in _LOSSES})
+        stats.update(_rates(stats))
+        species[int(sid)] = stats
+
+    return {"population": population, "species": species}
+
+
+def diff_generations(prev_data, curr_data, tweak_multiplier=None):
+    """
+    Reconstruct mutation events between two generation snapshots.
+
+    Args:
+        prev_data: The previous generation snapshot dictionary
+        curr_data: The current generation snapshot dictionary
+        tweak_multiplier: Largest weight change counted as a tweak
+            (default: TweakMultiplier from the current snapshot's config)
+
+    Returns:
+        The result of diff_flattened
+    """
+    if tweak_multiplier is None:
+        tweak_multiplier = curr_data["config"]["genomeConfig"]["TweakMultiplier"]
+
+    return diff_flattened(
+        flatten_generation(prev_data), flatten_generation(curr_data), tweak_multiplier
+    )
+
+
+def mutation_rates_over_generations(
+    generations_range, test_name="test-name", by_species=False
+):
+    """
+    Compute per-generation mutation event series for a run in one streaming pass.
+
+    Each snapshot is loaded once and only its flattened arrays are kept for
+    the next comparison. Generations are diffed against the previously loaded
+    one, so a step other than 1 measures changes over several generations.
+
+    Args:
+        generations_range: Range of generations to include (e.g., range(0, 100))
+        test_name: The test name prefix in the filenames (default: "test-name")
+        by_species: Whether to also return a series per species
+
+    Returns:
+        A dictionary with a "generation" list, one list per population count
+        and rate, the genome config of the run under "config", and with
+        by_species a "species" entry mapping species ids to series of the
+        same shape
+    """
+    series = {"generation": [], "config": None}
+    if by_species:
+        series["species"] = {}
+
+    prev = None
+
+    for gen in generations_range:
+        data = load_generation(gen, test_name)
+
+        if data is None:
+            print(f"Warning: No file found for generation {gen}")
+            continue
+
+        genome_config = data["config"]["genomeConfig"]
+        series["config"] = genome_config
+        curr = flatten_generation(data)
+
+        if prev is not None:
+            diff = diff_flattened(prev, curr, genome_config["TweakMultiplier"])
+
+            series["generation"].append(gen)
+            for key, value in diff["population"].items():
+                series.setdefault(key, []).append(value)
+
+            if by_species:
+                for sid, stats in diff["species"].items():
+                    species_series = series["species"].setdefault(
+                        sid, {"generation": []}
+                    )
+                    species_series["generation"].append(gen)
+                    for key, value in stats.items():
+                        species_series.setdefault(key, []).append(value)
+
+        prev = curr
+
+    return series
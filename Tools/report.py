@@ -0,0 +1,438 @@
+"""
+Headless report generator for a finished training run.
+
+Reads every generation snapshot of a run once and writes a self-contained
+HTML report with fitness, species, complexity and mutation-rate curves,
+best-genome diagrams, the run config and summary tables.
+
+Usage:
+    python report.py ../populations/final2 -g 0 100 200 365 -o final2.html
+"""
+
+import os
+import re
+import io
+import glob
+import html
+import base64
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+from utils import (
+    load_generation,
+    iter_genomes,
+    visualize_genome,
+    draw_fitness_stats,
+    draw_species_count,
+)
+from topology import generation_topology_stats, draw_complexity_stats
+from gene_diff import flatten_generation, diff_flattened
+
+
+def find_generations(test_name="test-name"):
+    """
+    List the generation numbers available for a run.
+
+    Args:
+        test_name: The test name prefix in the filenames (default: "test-name")
+
+    Returns:
+        A sorted list of generation numbers
+    """
+    pattern = re.compile(re.escape(os.path.basename(test_name)) + r"_(\d+)\.json$")
+    generations = []
+
+    for file in glob.glob(f"{glob.escape(test_name)}_*.json"):
+        match = pattern.match(os.path.basename(file))
+        if match:
+            generations.append(int(match.group(1)))
+
+    return sorted(generations)
+
+
+def _best_genome(data):
+    """The stored best genome of a snapshot, or its fittest member as a fallback."""
+    if "Best" in data:
+        return data["Best"]
+
+    return max(
+        (genome for _, genome in iter_genomes(data)),
+        key=lambda g: g["Fitness"],
+        default=None,
+    )
+
+
+def collect_run(generations, test_name="test-name", genome_generations=()):
+    """
+    Gather everything the report needs in a single pass over the snapshots.
+
+    Args:
+        generations: Generation numbers to read, in order
+        test_name: The test name prefix in the filenames (default: "test-name")
+        genome_generations: Generations whose best genome should be kept
+
+    Returns:
+        A dictionary with per-generation "series" (fitness, species, topology
+        and mutation-rate lists keyed by "generation"), the "best_genomes"
+        of genome_generations, the "config" and the "species" table of the
+        last generation
+    """
+    series = {"generation": []}
+    best_genomes = {}
+    config = None
+    last_species = []
+    prev = None
+
+    for gen in generations:
+        data = load_generation(gen, test_name)
+
+        if data is None:
+            print(f"Warning: No file found for generation {gen}")
+            continue
+
+        fitnesses = [g["Fitness"] for _, g in iter_genomes(data) if "Fitness" in g]
+        if not fitnesses:
+            print(f"Warning: No fitness data found for generation {gen}")
+            continue
+
+        best = _best_genome(data)
+        row = {
+            "avg_fitness": sum(fitnesses) / len(fitnesses),
+            "min_fitness": min(fitnesses),
+            "max_fitness": max(fitnesses),
+            "best_fitness": best["Fitness"] if best else None,
+            "species_count": len(data["Species"]),
+        }
+        # A per-generation cache keeps memory flat over long runs
+        row.update(generation_topology_stats(data, {}))
+
+        # Mutation rates need a previous generation to compare against
+        config = data.get("config", config)
+        curr = flatten_generation(data)
+        if prev is not None and config is not None:
+            diff = diff_flattened(prev, curr, config["genomeConfig"]["TweakMultiplier"])
+            row.update({f"mut_{k}": v for k, v in diff["population"].items()})
+        prev = curr
+
+        series["generation"].append(gen)
+        for key, value in row.items():
+            # Pad keys that first appear after the first generation
+            values = series.setdefault(key, [None] * (len(series["generation"]) - 1))
+            values.append(value)
+
+        if gen in genome_generations and best is not None:
+            best_genomes[gen] = best
+
+        last_species = [
+            {
+                "Id": species_data["Id"],
+                "Members": len(species_data["Members"]),
+                "Fitness": species_data.get("Fitness"),
+                "AdjustedFitness": species_data.get("AdjustedFitness"),
+                "LastImproved": species_data.get("LastImproved"),
+            }
+            for species_data in data["Species"].values()
+        ]
+
+    return {
+        "series": series,
+        "best_genomes": best_genomes,
+        "config": config,
+        "species": last_species,
+    }
+
+
+def _plot_mutation_rates(series, test_name, genome_config):
+    import matplotlib.pyplot as plt
+
+    fig, (ax_weights, ax_genes) = plt.subplots(2, 1, figsize=(12, 7), sharex=True)
+    generations = series["generation"]
+
+    ax_weights.plot(
+        generations, series["mut_tweak_rate"], "b-", label="Tweaked", linewidth=1.5
+    )
+    ax_weights.plot(
+        generations, series["mut_replace_rate"], "r-", label="Replaced", linewidth=1.5
+    )
+    ax_weights.plot(
+        generations,
+        series["mut_enable_rate"],
+        "g-",
+        label="Enabled",
+        linewidth=1,
+        alpha=0.7,
+    )
+    ax_weights.plot(
+        generations,
+        series["mut_disable_rate"],
+        "m-",
+        label="Disabled",
+        linewidth=1,
+        alpha=0.7,
+    )
+    if genome_config:
+        # A replace runs after the tweak in Genome.Mutate and overrides it
+        tweak_prob = genome_config["TweakWeightProb"]
+        replace_prob = genome_config["ReplaceWeightProb"]
+        ax_weights.axhline(
+            tweak_prob * (1 - replace_prob),
+            color="b",
+            linestyle=":",
+            label="Expected Tweaked",
+        )
+        # Closest-weight matching under-detects replacements, so the
+        # observed rate is expected to stay below this line
+        ax_weights.axhline(
+            replace_prob,
+            color="r",
+            linestyle=":",
+            label="ReplaceWeightProb (upper bound)",
+        )
+
+    ax_genes.plot(
+        generations,
+        series["mut_added_per_genome"],
+        "b-",
+        label="Genes Added",
+        linewidth=1.5,
+    )
+    ax_genes.plot(
+        generations,
+        series["mut_nodes_added_per_genome"],
+        "g-",
+        label="Nodes Added",
+        linewidth=1.5,
+    )
+
+    ax_weights.grid(True, linestyle="--", alpha=0.7)
+    ax_weights.set_ylabel("Fraction of Matched Genes", fontsize=12)
+    ax_weights.set_title(f"Observed Mutation Rates - {test_name}", fontsize=14)
+    ax_weights.legend(loc="upper right", frameon=True, fontsize=9, ncol=3)
+
+    ax_genes.grid(True, linestyle="--", alpha=0.7)
+    ax_genes.set_xlabel("Generation", fontsize=12)
+    ax_genes.set_ylabel("Per Genome", fontsize=12)
+    ax_genes.legend(loc="upper right", frameon=True, fontsize=9)
+
+    plt.tight_layout()
+    return fig
+
+
+# Drawing is shared with the notebook helpers; workers only skip plt.show()
+_PLOTS = {
+    "fitness": partial(draw_fitness_stats, show=False),
+    "species": partial(draw_species_count, show=False),
+    "complexity": partial(draw_complexity_stats, show=False),
+    "mutation": _plot_mutation_rates,
+    "genome": partial(visualize_genome, show=False),
+}
+
+
+def _render(job):
+    """Render one (plot name, args) job to PNG bytes in a worker process."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    name, args = job
+    fig = _PLOTS[name](*args)
+
+    buffer = io.BytesIO()
+    # Drop the version stamp so identical runs produce identical reports
+    fig.savefig(buffer, format="png", dpi=100, metadata={"Software": None})
+    plt.close(fig)
+
+    return buffer.getvalue()
+
+
+def _format(value):
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    if value is None:
+        return "-"
+    return str(value)
+
+
+def _table(headers, rows):
+    head = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(_format(v))}</td>" for v in row) + "</tr>"
+        for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _image(png):
+    return f'<img src="data:image/png;base64,{base64.b64encode(png).decode()}">'
+
+
+_STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 1250px; color: #222; }
+table { border-collapse: collapse; margin: 1em 0; font-size: 0.9em; }
+th, td { border: 1px solid #ccc; padding: 0.25em 0.6em; text-align: right; }
+th { background: #f0f0f0; }
+img { max-width: 100%; }
+"""
+
+
+def build_report(
+    test_name="test-name", genome_generations=None, output=None, jobs=None
+):
+    """
+    Generate the HTML report of a run.
+
+    Args:
+        test_name: The test name prefix in the filenames (default: "test-name")
+        genome_generations: Generations to draw the best genome of
+            (default: first, last and three evenly spaced in between)
+        output: Path of the HTML file (default: "{test_name}_report.html")
+        jobs: Number of rendering processes (default: number of CPUs)
+
+    Returns:
+        The path of the written report
+    """
+    generations = find_generations(test_name)
+    if not generations:
+        raise FileNotFoundError(f"No files found matching pattern {test_name}_*.json")
+
+    if genome_generations is None:
+        step = max(1, (len(generations) - 1) // 4)
+        genome_generations = sorted(set(generations[::step] + generations[-1:]))
+    if output is None:
+        output = f"{test_name}_report.html"
+
+    run = collect_run(generations, test_name, set(genome_generations))
+    series = run["series"]
+    config = run["config"] or {}
+    title = os.path.basename(test_name)
+
+    plot_jobs = [
+        ("fitness", (series, title)),
+        ("species", (series, title)),
+        ("complexity", (series, title)),
+    ]
+    if "mut_tweak_rate" in series:
+        plot_jobs.append(("mutation", (series, title, config.get("genomeConfig"))))
+    genome_gens = sorted(run["best_genomes"])
+    for gen in genome_gens:
+        genome = run["best_genomes"][gen]
+        plot_jobs.append(
+            (
+                "genome",
+                (
+                    genome,
+                    f"Best Genome - Generation {gen} (Fitness: {genome.get('Fitness', 'N/A')})",
+                ),
+            )
+        )
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        images = list(executor.map(_render, plot_jobs))
+
+    curves = images[: len(plot_jobs) - len(genome_gens)]
+    diagrams = images[len(curves) :]
+
+    # Summary rows for the generations whose genomes are drawn
+    summary_columns = [
+        ("Generation", "generation"),
+        ("Best", "best_fitness"),
+        ("Max", "max_fitness"),
+        ("Average", "avg_fitness"),
+        ("Species", "species_count"),
+        ("Genomes", "genomes"),
+        ("Unique Topologies", "unique_topologies"),
+        ("Mean Hidden", "mean_hidden_nodes"),
+        ("Mean Connections", "mean_enabled_connections"),
+        ("Max Depth", "max_depth"),
+        ("Cyclic", "cyclic_genomes"),
+        ("With Dangling", "dangling_genomes"),
+    ]
+    summary_rows = []
+    for gen in genome_generations:
+        if gen in series["generation"]:
+            idx = series["generation"].index(gen)
+            summary_rows.append([series[key][idx] for _, key in summary_columns])
+
+    config_rows = []
+    for section, values in config.items():
+        if isinstance(values, dict):
+            config_rows.extend([section, key, value] for key, value in values.items())
+        else:
+            config_rows.append(["", section, values])
+
+    species_rows = [
+        [s["Id"], s["Members"], s["Fitness"], s["AdjustedFitness"], s["LastImproved"]]
+        for s in sorted(
+            run["species"],
+            key=lambda s: s["Fitness"] if s["Fitness"] is not None else float("-inf"),
+            reverse=True,
+        )
+    ]
+
+    sections = [
+        f"<h1>Training Report - {html.escape(title)}</h1>",
+        f"<p>Generations {series['generation'][0]} to {series['generation'][-1]} "
+        f"({len(series['generation'])} snapshots)</p>",
+        "<h2>Summary</h2>",
+        _table([name for name, _ in summary_columns], summary_rows),
+        "<h2>Curves</h2>",
+        *[_image(png) for png in curves],
+        "<h2>Best Genomes</h2>",
+        *[_image(png) for png in diagrams],
+        f"<h2>Species in Generation {series['generation'][-1]}</h2>",
+        _table(
+            ["Id", "Members", "Fitness", "Adjusted Fitness", "Last Improved"],
+            species_rows,
+        ),
+        "<h2>Config</h2>",
+        _table(["Section", "Parameter", "Value"], config_rows),
+    ]
+
+    document = (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f"<title>Training Report - {html.escape(title)}</title>\n"
+        f"<style>{_STYLE}</style>\n</head>\n<body>\n"
+        + "\n".join(sections)
+        + "\n</body>\n</html>\n"
+    )
+
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(document)
+
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a static HTML report of a training run."
+    )
+    parser.add_argument(
+        "test_name",
+        help='Run prefix of the snapshot files, e.g. "../populations/final2"',
+    )
+    parser.add_argument(
+        "-g",
+        "--genomes",
+        type=int,
+        nargs="+",
+        help="Generations to draw the best genome of",
+    )
+    parser.add_argument(
+        "-o", "--output", help='Report path (default: "{test_name}_report.html")'
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of rendering processes (default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    output = build_report(args.test_name, args.genomes, args.output, args.jobs)
+    print(f"Report written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import os
+import re
+import json
+
+# Bumped whenever the index layout changes, so stale indexes get rebuilt
+INDEX_VERSION = 1
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+def index_path(snapshot_path):
+    """Path of the offset index stored next to a snapshot file."""
+    return snapshot_path + ".idx"
+
+
+def _skip_value(text, pos):
+    """Return the position right after the JSON value starting at pos."""
+    return _decoder.raw_decode(text, pos)[1]
+
+
+def _walk_object(text, pos, visit):
+    """
+    Walk the members of the JSON object starting at pos.
+
+    Args:
+        text: The JSON document
+        pos: Position of the opening brace
+        visit: Callback visit(key, value_start) returning the end of the value
+
+    Returns:
+        The position right after the closing brace
+    """
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text[pos] == "}":
+        return pos + 1
+
+    while True:
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos] != ":":
+            raise ValueError(f"Expected ':' at position {pos}")
+        pos = _WHITESPACE.match(text, pos + 1).end()
+        pos = _WHITESPACE.match(text, visit(key, pos)).end()
+        if text[pos] == "}":
+            return pos + 1
+        if text[pos] != ",":
+            raise ValueError(f"Expected ',' or '}}' at position {pos}")
+        pos = _WHITESPACE.match(text, pos + 1).end()
+
+
+def scan_snapshot(snapshot_path):
+    """
+    Find the byte spans of the best genome and every species member in a snapshot.
+
+    Only the top-level, species and members objects are walked explicitly;
+    every other value is skipped with the C JSON decoder, so a scan costs
+    about as much as a single json.load of the file.
+
+    Args:
+        snapshot_path: Path to a generation snapshot JSON file
+
+    Returns:
+        A tuple (best, members) where best is a [start, end] span or None and
+        members is a list of [species_id, genome_id, start, end] in file order
+    """
+    with open(snapshot_path, "rb") as f:
+        # latin-1 maps every byte to one character, so positions are byte offsets
+        text = f.read().decode("latin-1")
+
+    best = None
+    members = []
+
+    def visit_root(key, start):
+        nonlocal best
+        if key == "Species":
+            return _walk_object(text, start, visit_species)
+        end = _skip_value(text, start)
+        if key == "Best" and text[start] == "{":
+            best = [start, end]
+        return end
+
+    def visit_species(species_id, start):
+        def visit_field(key, field_start):
+            if key == "Members":
+                return _walk_object(text, field_start, visit_member)
+            return _skip_value(text, field_start)
+
+        def visit_member(genome_id, member_start):
+            end = _skip_value(text, member_start)
+            members.append([species_id, genome_id, member_start, end])
+            return end
+
+        return _walk_object(text, start, visit_field)
+
+    _walk_object(text, _WHITESPACE.match(text).end(), visit_root)
+
+    return best, members
+
+
+def build_index(i, test_name="test-name"):
+    """
+    Build and store the offset index of the ith generation with a specific test name.
+
+    Args:
+        i: The generation number
+        test_name: The test name prefix in the filename (default: "test-name")
+
+    Returns:
+        The index as a dictionary
+    """
+    snapshot_path = f"{test_name}_{i}.json"
+    if not os.path.exists(snapshot_path):
+        raise FileNotFoundError(f"No files found matching pattern {snapshot_path}")
+
+    stat = os.stat(snapshot_path)
+    best, members = scan_snapshot(snapshot_path)
+
+    index = {
+        "Version": INDEX_VERSION,
+        "Size": stat.st_size,
+        "MTime": stat.st_mtime_ns,
+        "Best": best,
+        "Members": members,
+    }
+
+    with open(index_path(snapshot_path), "w") as f:
+        json.dump(index, f)
+
+    return index
+
+
+def build_run_index(generations_range, test_name="test-name"):
+    """
+    Build offset indexes for all generations of a run, skipping up-to-date ones.
+
+    Args:
+        generations_range: Range of generations to include (e.g., range(0, 100, 5))
+        test_name: The test name prefix in the filenames (default: "test-name")
+
+    Returns:
+        The number of indexes that were (re)built
+    """
+    built = 0
+
+    for gen in generations_range:
+        if not os.path.exists(f"{test_name}_{gen}.json"):
+            print(f"Warning: No file found for generation {gen}")
+            continue
+
+        if load_index(gen, test_name) is None:
+            build_index(gen, test_name)
+            built += 1
+
+    return built
+
+
+def load_index(i, test_name="test-name"):
+    """
+    Load the offset index of the ith generation if it exists and is up to date.
+
+    Args:
+        i: The generation number
+        test_name: The test name prefix in the filename (default: "test-name")
+
+    Returns:
+        The index as a dictionary, or None if it is missing or stale
+    """
+    snapshot_path = f"{test_name}_{i}.json"
+
+    try:
+        with open(index_path(snapshot_path), "r") as f:
+            index = json.load(f)
+        stat = os.stat(snapshot_path)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        index.get("Version") != INDEX_VERSION
+        or index.get("Size") != stat.st_size
+        or index.get("MTime") != stat.st_mtime_ns
+    ):
+        return None
+
+    return index
+
+
+def read_span(snapshot_path, span):
+    """
+    Parse a single JSON value stored at a byte span of a snapshot.
+
+    Args:
+        snapshot_path: Path to a generation snapshot JSON file
+        span: A [start, end] byte span, or an index entry ending with one
+
+    Returns:
+        The parsed value
+    """
+    start, end = span[-2:]
+
+    with open(snapshot_path, "rb") as f:
+        f.seek(start)
+        return json.loads(f.read(end - start))
@@ -0,0 +1,298 @@
+from utils import load_generation, iter_genomes
+
+# Node types as serialized by NEAT.NodeGeneType
+SENSOR, HIDDEN, OUTPUT = 0, 1, 2
+
+# Connection status as serialized by NEAT.ConnectionStatus
+ENABLED = 0
+
+
+def canonical_topology(genome):
+    """
+    Reduce a genome to its structure, ignoring weights and disabled connections.
+
+    Two genomes with the same canonical topology build the same network graph
+    and only differ in connection weights.
+
+    Args:
+        genome: The genome dictionary containing NodeGenes and ConnectionGenes
+
+    Returns:
+        A tuple (nodes, edges) where nodes is a sorted tuple of (id, type)
+        pairs and edges is a sorted tuple of enabled (input, output) pairs
+    """
+    nodes = tuple(
+        sorted((node["Id"], node["Type"]) for node in genome["NodeGenes"].values())
+    )
+    edges = tuple(
+        sorted(
+            (conn["Connection"]["Input"], conn["Connection"]["Output"])
+            for conn in genome["ConnectionGenes"].values()
+            if conn["Status"] == ENABLED
+        )
+    )
+    return nodes, edges
+
+
+def compute_topology_stats(topology):
+    """
+    Compute structural metrics of a canonical topology.
+
+    Depth is the longest path (in connections) from any sensor to any output.
+    Dangling hidden nodes have no enabled incoming connection, so
+    NeuralNetwork evaluates them as 0. Dead-end hidden nodes have no path to
+    any output and never influence the network result.
+
+    Args:
+        topology: The canonical topology returned by canonical_topology
+
+    Returns:
+        A dictionary with hidden_nodes, enabled_connections, depth,
+        max_fan_in, max_fan_out, mean_fan_in, has_cycle, dangling_hidden
+        and dead_end_hidden. Depth is None if the graph has a cycle.
+    """
+    nodes, edges = topology
+    node_types = dict(nodes)
+
+    successors = {node_id: [] for node_id in node_types}
+    predecessors = {node_id: [] for node_id in node_types}
+    for source, target in edges:
+        # Connections to nodes missing from NodeGenes still count as structure
+        successors.setdefault(source, []).append(target)
+        successors.setdefault(target, [])
+        predecessors.setdefault(target, []).append(source)
+        predecessors.setdefault(source, [])
+
+    hidden = [n for n, t in node_types.items() if t == HIDDEN]
+    outputs = [n for n, t in node_types.items() if t == OUTPUT]
+    fan_in = {n: len(p) for n, p in predecessors.items()}
+    fan_out = {n: len(s) for n, s in successors.items()}
+
+    # Kahn's algorithm, tracking longest distance from sensors along the way
+    in_degree = dict(fan_in)
+    queue = [n for n, d in in_degree.items() if d == 0]
+    distance = {n: 0 for n in queue if node_types.get(n) == SENSOR}
+    visited = 0
+    while queue:
+        node = queue.pop()
+        visited += 1
+        for target in successors[node]:
+            if node in distance:
+                distance[target] = max(distance.get(target, 0), distance[node] + 1)
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                queue.append(target)
+    has_cycle = visited < len(in_degree)
+
+    if has_cycle:
+        depth = None
+    else:
+        depth = max((distance.get(n, 0) for n in outputs), default=0)
+
+    # Walk backwards from outputs to find nodes that influence the result
+    live = set(outputs)
+    stack = list(outputs)
+    while stack:
+        node = stack.pop()
+        for source in predecessors[node]:
+            if source not in live:
+                live.add(source)
+                stack.append(source)
+
+    non_sensors = [n for n in fan_in if node_types.get(n) != SENSOR]
+
+    return {
+        "hidden_nodes": len(hidden),
+        "enabled_connections": len(edges),
+        "depth": depth,
+        "max_fan_in": max(fan_in.values(), default=0),
+        "max_fan_out": max(fan_out.values(), default=0),
+        "mean_fan_in": (
+            sum(fan_in[n] for n in non_sensors) / len(non_sensors)
+            if non_sensors
+            else 0.0
+        ),
+        "has_cycle": has_cycle,
+        "dangling_hidden": sum(1 for n in hidden if fan_in[n] == 0),
+        "dead_end_hidden": sum(1 for n in hidden if n not in live),
+    }
+
+
+def get_topology_stats(genome, cache=None):
+    """
+    Get structural metrics of a genome, computing them once per unique topology.
+
+    The canonical topology tuple itself is the cache key. Within a generation
+    most genomes still differ in structure (on final2 about 190 of 195 are
+    unique, since each keeps its own dangling hidden nodes), so the cache
+    mainly lets callers count unique topologies rather than save time.
+
+    Args:
+        genome: The genome dictionary containing NodeGenes and ConnectionGenes
+        cache: Dictionary mapping canonical topologies to stats (default: no reuse)
+
+    Returns:
+        The stats dictionary from compute_topology_stats, shared by all
+        genomes with the same topology in cache
+    """
+    if cache is None:
+        cache = {}
+
+    topology = canonical_topology(genome)
+    stats = cache.get(topology)
+
+    if stats is None:
+        stats = cache[topology] = compute_topology_stats(topology)
+
+    return stats
+
+
+def generation_topology_stats(data, cache=None):
+    """
+    Summarize the topologies of all genomes in a generation snapshot.
+
+    Args:
+        data: The generation snapshot dictionary
+        cache: Dictionary mapping canonical topologies to stats (default: a fresh one)
+
+    Returns:
+        A dictionary with the number of genomes and unique topologies, the
+        mean and max of each numeric metric, and the number of genomes with
+        cycles or dangling hidden nodes
+    """
+    if cache is None:
+        cache = {}
+
+    all_stats = [get_topology_stats(genome, cache) for _, genome in iter_genomes(data)]
+
+    summary = {
+        "genomes": len(all_stats),
+        # Each unique topology maps to a single cached stats object
+        "unique_topologies": len({id(s) for s in all_stats}),
+        "cyclic_genomes": sum(1 for s in all_stats if s["has_cycle"]),
+        "dangling_genomes": sum(1 for s in all_stats if s["dangling_hidden"] > 0),
+    }
+
+    for metric in (
+        "hidden_nodes",
+        "enabled_connections",
+        "depth",
+        "max_fan_in",
+        "max_fan_out",
+    ):
+        values = [s[metric] for s in all_stats if s[metric] is not None]
+        summary[f"mean_{metric}"] = sum(values) / len(values) if values else None
+        summary[f"max_{metric}"] = max(values) if values else None
+
+    return summary
+
+
+def topology_stats_over_generations(
+    generations_range, test_name="test-name", cache=None
+):
+    """
+    Compute per-generation topology summaries for a run.
+
+    Args:
+        generations_range: Range of generations to include (e.g., range(0, 100, 5))
+        test_name: The test name prefix in the filenames (default: "test-name")
+        cache: Dictionary mapping canonical topologies to stats, reused across
+            generations (default: a fresh one per generation)
+
+    Returns:
+        A dictionary with a "generation" list and one list per summary field
+        of generation_topology_stats
+    """
+    series = {"generation": []}
+
+    for gen in generations_range:
+        data = load_generation(gen, test_name)
+
+        if data is None:
+            print(f"Warning: No file found for generation {gen}")
+            continue
+
+        series["generation"].append(gen)
+        for key, value in generation_topology_stats(data, cache).items():
+            series.setdefault(key, []).append(value)
+
+    return series
+
+
+def plot_complexity_stats(generations_range, test_name="test-name", figsize=(12, 6)):
+    """
+    Plot mean network complexity and topology diversity across generations.
+
+    Args:
+        generations_range: Range of generations to include (e.g., range(0, 100, 5))
+        test_name: The test name prefix in the filenames (default: "test-name")
+        figsize: Figure size tuple (width, height)
+
+    Returns:
+        The matplotlib figure object
+    """
+    series = topology_stats_over_generations(generations_range, test_name)
+    return draw_complexity_stats(series, test_name, figsize)
+
+
+def draw_complexity_stats(series, test_name="test-name", figsize=(12, 6), show=True):
+    """
+    Draw precomputed complexity series across generations.
+
+    Args:
+        series: Dictionary with "generation", "mean_hidden_nodes",
+            "mean_enabled_connections", "mean_depth" and "unique_topologies" lists
+        test_name: The test name shown in the title (default: "test-name")
+        figsize: Figure size tuple (width, height)
+        show: Whether to display the figure with plt.show()
+
+    Returns:
+        The matplotlib figure object
+    """
+    import matplotlib.pyplot as plt
+
+    generations = series["generation"]
+
+    fig, (ax, ax_unique) = plt.subplots(2, 1, figsize=figsize, sharex=True)
+
+    if generations:
+        ax.plot(
+            generations,
+            series["mean_hidden_nodes"],
+            "b-",
+            label="Hidden Nodes",
+            linewidth=2,
+        )
+        ax.plot(
+            generations,
+            series["mean_enabled_connections"],
+            "g-",
+            label="Enabled Connections",
+            linewidth=2,
+        )
+        ax.plot(generations, series["mean_depth"], "r--", label="Depth", linewidth=1.5)
+
+        ax_unique.plot(
+            generations,
+            series["unique_topologies"],
+            "k-",
+            label="Unique Topologies",
+            linewidth=2,
+        )
+
+    ax.grid(True, linestyle="--", alpha=0.7)
+    ax.set_ylabel("Mean per Genome", fontsize=12)
+    ax.set_title(f"Network Complexity Over Generations - {test_name}", fontsize=14)
+    ax.legend(loc="best", frameon=True, fontsize=10)
+
+    ax_unique.grid(True, linestyle="--", alpha=0.7)
+    ax_unique.set_xlabel("Generation", fontsize=12)
+    ax_unique.set_ylabel("Topologies", fontsize=12)
+    ax_unique.set_ylim(bottom=0)
+    ax_unique.legend(loc="best", frameon=True, fontsize=10)
+
+    plt.tight_layout()
+    if show:
+        plt.show()
+
+    return fig
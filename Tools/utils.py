@@ -1,4 +1,43 @@
-def get_genome(i, n, test_name="test-name"):
+def load_generation(i, test_name="test-name"):
+    """
+    Load the snapshot of the ith generation with a specific test name.
+
+    Args:
+        i: The generation number
+        test_name: The test name prefix in the filename (default: "test-name")
+
+    Returns:
+        The generation snapshot as a dictionary, or None if the file doesn't exist
+    """
+    import json
+    import glob
+
+    file_pattern = f"{test_name}_{i}.json"
+    matching_files = glob.glob(file_pattern)
+
+    if not matching_files:
+        return None
+
+    with open(matching_files[0], "r") as f:
+        return json.load(f)
+
+
+def iter_genomes(data):
+    """
+    Iterate over all genomes of a generation snapshot.
+
+    Args:
+        data: The generation snapshot dictionary
+
+    Yields:
+        Tuples of (species_id, genome_data) in file order
+    """
+    for species_id, species_data in data["Species"].items():
+        for genome_id, genome_data in species_data["Members"].items():
+            yield species_id, genome_data
+
+
+def get_genome(i, n, test_name="test-name", use_index=True):
     """
     Get the nth genome from the ith generation with a specific test name.
 
@@ -6,6 +45,8 @@ def get_genome(i, n, test_name="test-name"):
         i: The generation number
         n: The index of the genome to retrieve (0-based across all species)
         test_name: The test name prefix in the filename (default: "test-name")
+        use_index: Read only the genome's bytes if an up-to-date offset index
+            exists (see snapshot_index.build_run_index)
 
     Returns:
         The genome data as a dictionary, or None if not found
@@ -21,6 +62,15 @@ def get_genome(i, n, test_name="test-name"):
     if not matching_files:
         raise FileNotFoundError(f"No files found matching pattern {file_pattern}")
 
+    if use_index:
+        from snapshot_index import load_index, read_span
+
+        index = load_index(i, test_name)
+        if index is not None:
+            if n >= len(index["Members"]):
+                return None
+            return read_span(matching_files[0], index["Members"][n])
+
     # Load the JSON data
     with open(matching_files[0], "r") as f:
         data = json.load(f)
@@ -39,13 +89,15 @@ def get_genome(i, n, test_name="test-name"):
     return all_genomes[n]
 
 
-def get_best_genome(i, test_name="test-name"):
+def get_best_genome(i, test_name="test-name", use_index=True):
     """
     Get the best genome from the ith generation with a specific test name.
 
     Args:
         i: The generation number
         test_name: The test name prefix in the filename (default: "test-name")
+        use_index: Read only the best genome's bytes if an up-to-date offset
+            index exists (see snapshot_index.build_run_index)
 
     Returns:
         The best genome data as a dictionary, or None if not found
@@ -61,6 +113,14 @@ def get_best_genome(i, test_name="test-name"):
     if not matching_files:
         raise FileNotFoundError(f"No files found matching pattern {file_pattern}")
 
+    if use_index:
+        from snapshot_index import load_index, read_span
+
+        index = load_index(i, test_name)
+        # Without a "Best" field we still need the full file for the fallback
+        if index is not None and index["Best"] is not None:
+            return read_span(matching_files[0], index["Best"])
+
     # Load the JSON data
     with open(matching_files[0], "r") as f:
         data = json.load(f)
@@ -228,7 +288,7 @@ def get_best_genome(i, test_name="test-name"):
 #     plt.show()
 
 
-def visualize_genome(genome, title=None, figsize=(10, 8)):
+def visualize_genome(genome, title=None, figsize=(10, 8), show=True):
     """
     Visualize a genome as a neural network graph with better distribution of hidden neurons.
 
@@ -236,6 +296,7 @@ def visualize_genome(genome, title=None, figsize=(10, 8)):
         genome: The genome dictionary containing NodeGenes and ConnectionGenes
         title: Optional title for the plot
         figsize: Figure size tuple (width, height)
+        show: Whether to display the figure with plt.show()
 
     Returns:
         The matplotlib figure object
@@ -473,7 +534,10 @@ def visualize_genome(genome, title=None, figsize=(10, 8)):
     ax.set_frame_on(False)
 
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+
+    return fig
 
 
 def plot_fitness_stats(
@@ -492,7 +556,6 @@ def plot_fitness_stats(
         The matplotlib figure object
     """
     import numpy as np
-    import matplotlib.pyplot as plt
     import json
     import glob
     import os
@@ -539,6 +602,41 @@ def plot_fitness_stats(
         if include_best and "Best" in data and "Fitness" in data["Best"]:
             best_fitness.append(data["Best"]["Fitness"])
 
+    series = {
+        "generation": generations,
+        "avg_fitness": avg_fitness,
+        "min_fitness": min_fitness,
+        "max_fitness": max_fitness,
+        "best_fitness": best_fitness,
+    }
+    return draw_fitness_stats(series, test_name, figsize, include_best)
+
+
+def draw_fitness_stats(
+    series, test_name="test-name", figsize=(12, 6), include_best=True, show=True
+):
+    """
+    Draw precomputed fitness statistics across generations.
+
+    Args:
+        series: Dictionary with "generation", "avg_fitness", "min_fitness",
+            "max_fitness" and "best_fitness" lists
+        test_name: The test name shown in the title (default: "test-name")
+        figsize: Figure size tuple (width, height)
+        include_best: Whether to include the best genome's fitness separately
+        show: Whether to display the figure with plt.show()
+
+    Returns:
+        The matplotlib figure object
+    """
+    import matplotlib.pyplot as plt
+
+    generations = series["generation"]
+    avg_fitness = series["avg_fitness"]
+    min_fitness = series["min_fitness"]
+    max_fitness = series["max_fitness"]
+    best_fitness = series.get("best_fitness", [])
+
     # Create the plot
     fig, ax = plt.subplots(figsize=figsize)
 
@@ -609,7 +707,10 @@ def plot_fitness_stats(
             )
 
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+
+    return fig
 
 
 def plot_species_count(
@@ -627,10 +728,8 @@ def plot_species_count(
     Returns:
         The matplotlib figure object
     """
-    import matplotlib.pyplot as plt
     import json
     import glob
-    import numpy as np
 
     # Data storage
     generations = []
@@ -657,6 +756,32 @@ def plot_species_count(
         else:
             print(f"Warning: No species data found for generation {gen}")
 
+    series = {"generation": generations, "species_count": species_counts}
+    return draw_species_count(series, test_name, figsize, moving_avg_window)
+
+
+def draw_species_count(
+    series, test_name="test-name", figsize=(10, 6), moving_avg_window=None, show=True
+):
+    """
+    Draw a precomputed number of species across generations.
+
+    Args:
+        series: Dictionary with "generation" and "species_count" lists
+        test_name: The test name shown in the title (default: "test-name")
+        figsize: Figure size tuple (width, height)
+        moving_avg_window: If provided, adds a moving average line with the specified window size
+        show: Whether to display the figure with plt.show()
+
+    Returns:
+        The matplotlib figure object
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    generations = series["generation"]
+    species_counts = series["species_count"]
+
     # Create the plot
     fig, ax = plt.subplots(figsize=figsize)
 
@@ -743,4 +868,7 @@ def plot_species_count(
             )
 
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+
+    return fig